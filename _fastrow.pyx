@@ -0,0 +1,113 @@
+# cython: language_level=3
+"""
+Native fast path for TransactionProcessor row standardization.
+
+Build in place with ``cythonize -i _fastrow.pyx``. transaction_processor uses
+the compiled module when it can be imported and otherwise stays pure Python.
+Inputs the fast path does not recognize are handed to the Python parsers, so
+results and error messages are identical either way.
+"""
+
+cdef extern from "Python.h":
+    double PyOS_string_to_double(const char *s, char **endptr,
+                                 object overflow_exception) except? -1.0
+
+cdef inline int _days_in_month(int year, int month):
+    if month == 2:
+        return 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
+    if month == 4 or month == 6 or month == 9 or month == 11:
+        return 30
+    return 31
+
+cdef inline bint _valid_date(int year, int month, int day):
+    return year >= 1 and 1 <= month <= 12 and 1 <= day <= _days_in_month(year, month)
+
+cdef bint _split_date(str s, int values[3], int widths[3], Py_UCS4 *sep):
+    """Split s into three runs of at most 4 ASCII digits joined by one '-' or '/'"""
+    cdef int field = 0
+    cdef Py_UCS4 ch
+    values[0] = values[1] = values[2] = 0
+    widths[0] = widths[1] = widths[2] = 0
+    sep[0] = 0
+    for ch in s:
+        if u'0' <= ch <= u'9':
+            if widths[field] == 4:
+                return False
+            values[field] = values[field] * 10 + (<int>ch - 48)
+            widths[field] += 1
+        elif (ch == u'-' or ch == u'/') and widths[field] and field < 2 \
+                and (sep[0] == 0 or sep[0] == ch):
+            sep[0] = ch
+            field += 1
+        else:
+            return False
+    return field == 2 and widths[2] > 0
+
+cdef str _fast_date(str s):
+    """Return YYYY-MM-DD, or None when the Python parser must decide"""
+    cdef int values[3]
+    cdef int widths[3]
+    cdef Py_UCS4 sep
+    cdef int year, month, day
+    if not _split_date(s, values, widths, &sep):
+        return None
+    if widths[0] == 4 and widths[1] <= 2 and widths[2] <= 2:
+        # YYYY-MM-DD or YYYY/MM/DD
+        year, month, day = values[0], values[1], values[2]
+    elif sep == u'/' and widths[0] <= 2 and widths[1] <= 2 and widths[2] == 4:
+        # MM/DD/YYYY, then DD/MM/YYYY
+        year, month, day = values[2], values[0], values[1]
+        if not _valid_date(year, month, day):
+            month, day = day, month
+    else:
+        return None
+    if not _valid_date(year, month, day):
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+cdef object _fast_amount(str s):
+    """Return the amount as a float, or None when the Python parser must decide"""
+    cdef char buf[64]
+    cdef char *end
+    cdef Py_ssize_t k = 0
+    cdef Py_UCS4 ch
+    cdef double value
+    for ch in s:
+        if ch == u'$' or ch == u'£' or ch == u'€' or ch == u',' \
+                or ch == u' ' or ch == u'\t' or ch == u'\u00a0':
+            continue
+        if ch > 127 or k == 63:
+            return None
+        buf[k] = <char>ch
+        k += 1
+    if k == 0:
+        return None
+    buf[k] = 0
+    try:
+        value = PyOS_string_to_double(buf, &end, None)
+    except ValueError:
+        # No prefix parses (e.g. leading whitespace or NUL); let Python decide
+        return None
+    if end != buf + k:
+        return None
+    return value
+
+cpdef tuple parse_row(list row, tuple indices, object parse_date, object parse_amount):
+    """
+    Standardize one CSV row given the column indices from _resolve_columns.
+
+    parse_date and parse_amount are the Python parsers, used for any value
+    the fast path does not handle (including invalid ones, so they raise).
+    """
+    # Index in the same order as the Python path so a short row fails with
+    # the same error; row is bounds-checked like any Python list access
+    cdef str date_str = row[<Py_ssize_t>indices[0]]
+    date = _fast_date(date_str)
+    if date is None:
+        date = parse_date(date_str)
+    description = row[<Py_ssize_t>indices[1]].strip()
+    cdef str amount_str = row[<Py_ssize_t>indices[2]]
+    amount = _fast_amount(amount_str)
+    if amount is None:
+        amount = parse_amount(amount_str)
+    return (date, description, amount, row[<Py_ssize_t>indices[3]].strip())
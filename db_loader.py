@@ -1,93 +1,566 @@
 import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_batch, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import csv
-from typing import Dict, List
-from datetime import datetime
-from transaction_processor import TransactionProcessor
+import io
+import math
+import struct
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from decimal import Decimal
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import date
+from transaction_processor import TransactionProcessor, iter_chunk
 import os
+from urllib.parse import quote
+
+# Number of rows buffered in memory per load batch
+BATCH_SIZE = 100_000
+# Number of rows sent per multi-VALUES INSERT statement
+INSERT_PAGE_SIZE = 1000
+
+# Idempotent DDL for the target table and the COPY staging table
+CREATE_TRANSACTIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS transactions (
+        id SERIAL PRIMARY KEY,
+        transaction_date DATE NOT NULL,
+        description TEXT NOT NULL,
+        amount DECIMAL(10,2) NOT NULL,
+        category VARCHAR(100),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+CREATE_STAGING_TABLE = """
+    CREATE UNLOGGED TABLE IF NOT EXISTS transactions_staging (
+        transaction_date DATE NOT NULL,
+        description TEXT NOT NULL,
+        amount DECIMAL(10,2) NOT NULL,
+        category VARCHAR(100)
+    )
+"""
+
+# COPY loads go straight into transactions, or into the UNLOGGED
+# transactions_staging table when staging is enabled (see _bulk_load)
+COPY_QUERY = sql.SQL(
+    "COPY {} (transaction_date, description, amount, category) "
+    "FROM STDIN WITH (FORMAT BINARY)"
+)
+COPY_CSV_QUERY = sql.SQL(
+    "COPY {} (transaction_date, description, amount, category) "
+    "FROM STDIN WITH CSV"
+)
+
+# PostgreSQL binary COPY framing: signature, flags and header extension
+# length, then per row a field count and length-prefixed fields
+_PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_PGCOPY_TRAILER = struct.pack('>h', -1)
+# Field count plus the length-prefixed DATE field (days since 2000-01-01)
+_ROW_START = struct.Struct('>hii')
+_FIELD_LENGTH = struct.Struct('>i')
+_PG_EPOCH = date(2000, 1, 1).toordinal()
+
+# Shared by every loader in the process, created on first use
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def _connection_params() -> Dict[str, Optional[str]]:
+    """Connection settings read from environment variables"""
+    return {
+        'dbname': os.environ.get('DB_NAME'),
+        'user': os.environ.get('DB_USER'),
+        'password': os.environ.get('DB_PASSWORD'),
+        'host': os.environ.get('DB_HOST'),
+        'port': os.environ.get('DB_PORT', '5432')
+    }
+
+def _connection_uri() -> str:
+    """Connection settings from environment variables as a postgresql:// URI"""
+    params = _connection_params()
+    credentials = quote(params['user'] or '', safe='')
+    if params['password']:
+        credentials += ':' + quote(params['password'], safe='')
+    return (f"postgresql://{credentials}@{params['host'] or ''}:{params['port']}/"
+            f"{quote(params['dbname'] or '', safe='')}")
+
+def get_connection_pool() -> ThreadedConnectionPool:
+    """
+    Return the process-wide connection pool, creating it from environment
+    variables on first use so repeated loads skip the connect handshake.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = ThreadedConnectionPool(1, os.cpu_count() or 1, **_connection_params())
+            except psycopg2.Error as e:
+                raise Exception(f"Database connection error: {str(e)}")
+        return _pool
 
 class PostgresTransactionLoader:
     """
     A class to handle loading transaction data into a PostgreSQL database
     """
     
-    def __init__(self):
-        """Initialize database connection using environment variables"""
+    def __init__(self, pool: Optional[ThreadedConnectionPool] = None, use_copy: bool = True,
+                 prepare_inserts: bool = False, rebuild_indexes: bool = False,
+                 staged: bool = False):
+        """
+        Initialize database connection using environment variables
+
+        Args:
+            pool (Optional[ThreadedConnectionPool]): Pool to borrow the
+                connection from, defaults to get_connection_pool()
+            use_copy (bool): Load rows with COPY FROM STDIN. Set to False for
+                environments where COPY is not permitted to fall back to INSERT.
+            prepare_inserts (bool): On the INSERT path, execute a server-side
+                prepared statement in batches instead of multi-VALUES INSERTs.
+            rebuild_indexes (bool): Drop the table's indexes and primary key
+                before loading and rebuild them once afterwards. Worthwhile
+                for loads that are large relative to the existing table.
+            staged (bool): On the COPY path, copy into the UNLOGGED
+                transactions_staging table and merge it into transactions
+                with one INSERT ... SELECT. Every row is written twice and
+                concurrent staged loads queue on the staging table's lock,
+                so this only pays off when the direct COPY itself must be
+                kept short (e.g. to limit lock time on transactions).
+        """
+        self.pool = pool
         self.conn = None
         self.cursor = None
+        self.use_copy = use_copy
+        self.prepare_inserts = prepare_inserts
+        self.rebuild_indexes = rebuild_indexes
+        self.staged = staged
+        self._prepared = False
         
     def connect(self):
-        """Establish connection to PostgreSQL database using environment variables"""
+        """Borrow a connection to PostgreSQL from the connection pool"""
+        if self.pool is None:
+            self.pool = get_connection_pool()
         try:
-            self.conn = psycopg2.connect(
-                dbname=os.environ.get('DB_NAME'),
-                user=os.environ.get('DB_USER'),
-                password=os.environ.get('DB_PASSWORD'),
-                host=os.environ.get('DB_HOST'),
-                port=os.environ.get('DB_PORT', '5432')
-            )
+            self.conn = self.pool.getconn()
+            # Loads rely on statements grouping into one transaction per commit
+            self.conn.autocommit = False
             self.cursor = self.conn.cursor()
+            self._prepared = False
         except psycopg2.Error as e:
             raise Exception(f"Database connection error: {str(e)}")
 
     def create_transactions_table(self):
-        """Create the transactions table if it doesn't exist"""
+        """Create the transactions table and its COPY staging table if they don't exist"""
         try:
-            create_table_query = """
-                CREATE TABLE IF NOT EXISTS transactions (
-                    id SERIAL PRIMARY KEY,
-                    transaction_date DATE NOT NULL,
-                    description TEXT NOT NULL,
-                    amount DECIMAL(10,2) NOT NULL,
-                    category VARCHAR(100),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """
-            self.cursor.execute(create_table_query)
+            self._create_tables()
             self.conn.commit()
         except psycopg2.Error as e:
             self.conn.rollback()
             raise Exception(f"Error creating table: {str(e)}")
 
-    def load_transactions(self, transactions: List[Dict]):
+    def bulk_load(self, transactions: Iterable[Tuple]) -> int:
         """
-        Load transactions into the database
+        Create the tables if needed and load transactions, all in a single
+        transaction with one commit.
         
         Args:
-            transactions (List[Dict]): List of transaction dictionaries
+            transactions (Iterable[Tuple]): (date, description, amount, category) rows
+            
+        Returns:
+            int: Number of rows loaded
         """
         try:
-            insert_query = """
-                INSERT INTO transactions (transaction_date, description, amount, category)
-                VALUES (%(date)s, %(description)s, %(amount)s, %(category)s)
-            """
-            self.cursor.executemany(insert_query, transactions)
+            self._create_tables()
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            raise Exception(f"Error creating table: {str(e)}")
+        return self.load_transactions(transactions)
+
+    def _create_tables(self):
+        """Issue the idempotent DDL for the tables, without committing"""
+        self.cursor.execute(CREATE_TRANSACTIONS_TABLE + ';' + CREATE_STAGING_TABLE)
+
+    def load_transactions(self, transactions: Iterable[Tuple]) -> int:
+        """
+        Load transactions into the database, consuming the input in batches of
+        BATCH_SIZE rows so it can be streamed straight from the CSV file.
+        
+        Args:
+            transactions (Iterable[Tuple]): (date, description, amount, category) rows
+            
+        Returns:
+            int: Number of rows loaded
+        """
+        count = 0
+        with self._bulk_load(staged=self.use_copy and self.staged):
+            for batch in _batched(transactions, BATCH_SIZE):
+                if self.use_copy:
+                    self._copy_transactions(batch)
+                else:
+                    self._insert_transactions(batch)
+                count += len(batch)
+        return count
+
+    def load_dataframe(self, df) -> int:
+        """
+        Load a standardized DataFrame (see TransactionProcessor.load_dataframe).
+        With COPY enabled the frame is serialized by pandas in one pass rather
+        than converted to Python rows.
+        
+        Args:
+            df (pandas.DataFrame): Columns date, description, amount, category
+            
+        Returns:
+            int: Number of rows loaded
+        """
+        if not self.use_copy:
+            return self.load_transactions(df.itertuples(index=False, name=None))
+        with self._bulk_load(staged=self.staged):
+            buf = io.StringIO()
+            # COPY CSV reads an empty field as NULL; send NaN as the binary path does
+            df.to_csv(buf, header=False, index=False, quoting=csv.QUOTE_NONNUMERIC, na_rep='NaN')
+            buf.seek(0)
+            self.cursor.copy_expert(COPY_CSV_QUERY.format(sql.Identifier(self._copy_table())), buf)
+        return len(df)
+
+    def load_parallel(self, processor: TransactionProcessor, workers: Optional[int] = None) -> int:
+        """
+        Parse and COPY the processor's CSV file from several worker
+        processes, each with its own connection and UNLOGGED staging table
+        (transactions_staging_<n>), then merge the staging tables into
+        transactions in one transaction. If any worker or the merge fails,
+        the staging tables are dropped so no rows are left behind. Only one
+        parallel load should run against a database at a time, since the
+        staging tables are shared.
+        
+        Args:
+            processor (TransactionProcessor): Processor for the CSV file; the
+                file is split as in TransactionProcessor.parse_parallel
+            workers (Optional[int]): Number of worker processes, defaults to
+                the CPU count
+            
+        Returns:
+            int: Number of rows loaded
+        """
+        workers = workers or os.cpu_count() or 1
+        indices, ranges = processor.split_file(workers)
+        tables = [f'transactions_staging_{i}' for i in range(len(ranges))]
+        # The workers' staging tables are created LIKE transactions_staging
+        self.create_transactions_table()
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_copy_chunk, processor.file_path, start, end, indices, table)
+                           for (start, end), table in zip(ranges, tables)]
+                count = sum(future.result() for future in futures)
+        except Exception as e:
+            self._drop_staging_tables(tables)
+            raise Exception(f"Error loading transactions: {str(e)}")
+
+        try:
+            with self._bulk_load(staged=False):
+                for table in tables:
+                    self.cursor.execute(sql.SQL("""
+                        INSERT INTO transactions (transaction_date, description, amount, category)
+                        SELECT transaction_date, description, amount, category FROM {table};
+                        TRUNCATE {table}
+                    """).format(table=sql.Identifier(table)))
+        except Exception:
+            self._drop_staging_tables(tables)
+            raise
+        return count
+
+    def _drop_staging_tables(self, tables: List[str]):
+        """Drop the parallel load's staging tables after a failed load"""
+        try:
+            for table in tables:
+                self.cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(table)))
+            self.conn.commit()
+        except psycopg2.Error:
+            self.conn.rollback()
+
+    @contextmanager
+    def _bulk_load(self, staged: bool):
+        """
+        Run the enclosed load as one transaction tuned for bulk loading. It
+        commits once, without waiting for the WAL flush; a crash can lose the
+        most recent load but never leaves it half applied.
+
+        Args:
+            staged (bool): The enclosed load writes to transactions_staging,
+                which is merged into transactions at the end and emptied
+                before and after. The staging write skips WAL, but the merge
+                is WAL-logged like any INSERT, so each row is written twice.
+                TRUNCATE locks the staging table until commit, so concurrent
+                staged loads queue.
+        """
+        try:
+            self.cursor.execute("SET LOCAL synchronous_commit TO off")
+            self.cursor.execute("SET LOCAL maintenance_work_mem TO '1GB'")
+            if staged:
+                self.cursor.execute("TRUNCATE transactions_staging")
+            recreate = self._disable_indexes() if self.rebuild_indexes else []
+            yield
+            if staged:
+                self.cursor.execute("""
+                    INSERT INTO transactions (transaction_date, description, amount, category)
+                    SELECT transaction_date, description, amount, category
+                    FROM transactions_staging
+                """)
+                self.cursor.execute("TRUNCATE transactions_staging")
+            self._enable_indexes(recreate)
             self.conn.commit()
         except psycopg2.Error as e:
             self.conn.rollback()
             raise Exception(f"Error loading transactions: {str(e)}")
+        except Exception:
+            # A bad source row aborts the whole load, not just its batch
+            self.conn.rollback()
+            raise
+
+    def _disable_indexes(self) -> List[sql.Composable]:
+        """
+        Drop the primary key, unique constraints and indexes on the
+        transactions table. Fails if another table references the key.
+
+        Returns:
+            List[sql.Composable]: Statements that recreate what was dropped
+        """
+        self.cursor.execute("""
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = 'transactions'::regclass AND contype IN ('p', 'u')
+        """)
+        constraints = self.cursor.fetchall()
+        self.cursor.execute("""
+            SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+            FROM pg_index i
+            WHERE indrelid = 'transactions'::regclass
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """)
+        indexes = self.cursor.fetchall()
+
+        recreate = []
+        for name, definition in constraints:
+            self.cursor.execute(sql.SQL("ALTER TABLE transactions DROP CONSTRAINT {}")
+                                .format(sql.Identifier(name)))
+            recreate.append(sql.SQL("ALTER TABLE transactions ADD CONSTRAINT {} {}")
+                            .format(sql.Identifier(name), sql.SQL(definition)))
+        for name, definition in indexes:
+            self.cursor.execute(sql.SQL("DROP INDEX {}").format(sql.SQL(name)))
+            recreate.append(sql.SQL(definition))
+        return recreate
+
+    def _enable_indexes(self, recreate: List[sql.Composable]):
+        """Recreate the constraints and indexes dropped by _disable_indexes"""
+        for statement in recreate:
+            self.cursor.execute(statement)
+
+    def _copy_transactions(self, rows: List[Tuple]):
+        """
+        Send a batch of rows to the server with binary COPY FROM STDIN, so
+        the server does not have to parse dates and amounts from text.
+
+        Args:
+            rows (List[Tuple]): (date, description, amount, category) rows
+        """
+        _copy_binary(self.cursor, self._copy_table(), rows)
+
+    def _copy_table(self) -> str:
+        """Table the COPY path writes to"""
+        return 'transactions_staging' if self.staged else 'transactions'
+
+    def _insert_transactions(self, rows: List[Tuple]):
+        """
+        Insert a batch of rows with multi-row INSERT statements, for tables
+        where INSERT semantics (triggers, rules) are required.
+
+        Args:
+            rows (List[Tuple]): (date, description, amount, category) rows
+        """
+        insert_query = """
+            INSERT INTO transactions (transaction_date, description, amount, category)
+            VALUES %s
+        """
+        if self.prepare_inserts:
+            self._prepare_insert()
+            execute_batch(self.cursor, "EXECUTE insert_transaction (%s, %s, %s, %s)",
+                          rows, page_size=INSERT_PAGE_SIZE)
+        else:
+            execute_values(self.cursor, insert_query, rows, page_size=INSERT_PAGE_SIZE)
+
+    def _prepare_insert(self):
+        """Prepare the INSERT statement once per connection"""
+        if self._prepared:
+            return
+        # Pooled connections may already have it from an earlier loader
+        self.cursor.execute(
+            "SELECT 1 FROM pg_prepared_statements WHERE name = 'insert_transaction'")
+        if self.cursor.fetchone():
+            self._prepared = True
+            return
+        self.cursor.execute("""
+            PREPARE insert_transaction (DATE, TEXT, DECIMAL, VARCHAR) AS
+            INSERT INTO transactions (transaction_date, description, amount, category)
+            VALUES ($1, $2, $3, $4)
+        """)
+        self._prepared = True
 
     def close(self):
-        """Close database connection"""
+        """Return the database connection to the pool"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
+            self.pool.putconn(self.conn)
+            self.conn = None
+
+def ingest_arrow(table) -> int:
+    """
+    Load a standardized pyarrow Table (see TransactionProcessor.load_arrow_table)
+    through ADBC, whose ingest streams Arrow data with binary COPY. Rows land
+    in a temporary table and are merged into transactions with one
+    INSERT ... SELECT, so the existing table schema and defaults apply. The
+    transactions table is created if needed, in the same transaction.
+    Requires adbc-driver-postgresql. Covered by unit tests against a stubbed
+    driver only, not yet run against a live server.
+    
+    Args:
+        table (pyarrow.Table): Columns date, description, amount, category
+        
+    Returns:
+        int: Number of rows loaded
+    """
+    try:
+        import adbc_driver_postgresql.dbapi as adbc
+    except ImportError:
+        raise ImportError("adbc-driver-postgresql is required for Arrow ingest: "
+                          "pip install adbc-driver-postgresql")
+
+    table = table.rename_columns(['transaction_date', 'description', 'amount', 'category'])
+    try:
+        with adbc.connect(_connection_uri()) as conn, conn.cursor() as cursor:
+            cursor.execute(CREATE_TRANSACTIONS_TABLE)
+            cursor.execute("SET LOCAL synchronous_commit TO off")
+            cursor.adbc_ingest('transactions_arrow_staging', table, mode='replace', temporary=True)
+            cursor.execute("""
+                INSERT INTO transactions (transaction_date, description, amount, category)
+                SELECT transaction_date, description, amount, category
+                FROM transactions_arrow_staging
+            """)
+            conn.commit()
+    except adbc.Error as e:
+        raise Exception(f"Error loading transactions: {str(e)}")
+    return table.num_rows
+
+def _copy_binary(cursor, table: str, rows: List[Tuple]):
+    """
+    Send rows to a table with binary COPY FROM STDIN, so the server does not
+    have to parse dates and amounts from text.
+
+    Args:
+        cursor: Cursor of the connection to load through
+        table (str): Target table name
+        rows (List[Tuple]): (date, description, amount, category) rows
+    """
+    encoding = psycopg2.extensions.encodings[cursor.connection.encoding]
+    buf = _encode_binary_copy(rows, encoding)
+    cursor.copy_expert(COPY_QUERY.format(sql.Identifier(table)), buf)
+
+def _encode_binary_copy(rows: List[Tuple], encoding: str) -> io.BytesIO:
+    """
+    Encode rows as a complete binary COPY stream, positioned at its start.
+
+    Args:
+        rows (List[Tuple]): (date, description, amount, category) rows
+        encoding (str): Python codec matching the connection's client encoding
+    """
+    buf = io.BytesIO()
+    write = buf.write
+    write(_PGCOPY_HEADER)
+    for txn_date, description, amount, category in rows:
+        days = date.fromisoformat(txn_date).toordinal() - _PG_EPOCH
+        write(_ROW_START.pack(4, 4, days))
+        for value in (description.encode(encoding), _encode_numeric(amount),
+                      category.encode(encoding)):
+            write(_FIELD_LENGTH.pack(len(value)))
+            write(value)
+    write(_PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+def _copy_chunk(file_path: str, start: int, end: int,
+                indices: Tuple[int, int, int, int], table: str) -> int:
+    """
+    Parse one byte range of a CSV file and COPY it into its own UNLOGGED
+    staging table over a new connection (worker process entry point). Rows
+    are streamed in batches, so a worker never holds its whole range.
+
+    Returns:
+        int: Number of rows copied
+    """
+    count = 0
+    conn = psycopg2.connect(**_connection_params())
+    try:
+        with conn.cursor() as cursor:
+            table_id = sql.Identifier(table)
+            cursor.execute(sql.SQL("""
+                CREATE UNLOGGED TABLE IF NOT EXISTS {} (LIKE transactions_staging);
+                TRUNCATE {}
+            """).format(table_id, table_id))
+            for batch in _batched(iter_chunk(file_path, start, end, indices), BATCH_SIZE):
+                _copy_binary(cursor, table, batch)
+                count += len(batch)
+        conn.commit()
+    finally:
+        conn.close()
+    return count
+
+def _encode_numeric(value: float) -> bytes:
+    """Encode a number in PostgreSQL's binary NUMERIC format (base-10000 digits)"""
+    if math.isnan(value):
+        return struct.pack('>hhHh', 0, 0, 0xC000, 0)
+    if math.isinf(value):
+        return struct.pack('>hhHh', 0, 0, 0xD000 if value > 0 else 0xF000, 0)
+    # repr gives the shortest decimal that round-trips, e.g. 12.34 not 12.339999...
+    sign, digits, exponent = Decimal(repr(value)).as_tuple()
+    dscale = max(0, -exponent)
+    # Align the exponent to a multiple of 4 and the digits to whole groups
+    shift = exponent % 4
+    text = ''.join(map(str, digits)) + '0' * shift
+    exponent -= shift
+    text = '0' * (-len(text) % 4) + text
+    groups = [int(text[i:i + 4]) for i in range(0, len(text), 4)]
+    weight = len(groups) - 1 + exponent // 4
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight, sign = 0, 0
+    return struct.pack(f'>hhHh{len(groups)}H', len(groups), weight,
+                       0x4000 if sign else 0, dscale, *groups)
+
+def _batched(rows: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+    """Yield successive lists of at most size rows"""
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
 
 def main():
     # Initialize the transaction processor and postgres loader
+    loader = PostgresTransactionLoader()
     try:
-        # First process the CSV file using your existing TransactionProcessor
         processor = TransactionProcessor('transactions.csv', 'DSC.json')
-        processor.load_transactions()
-        transactions = processor.get_transactions()
 
-        # Now load the processed transactions into PostgreSQL
-        loader = PostgresTransactionLoader()
+        # Stream the standardized CSV rows straight into PostgreSQL
         loader.connect()
-        loader.create_transactions_table()
-        loader.load_transactions(transactions)
+        count = loader.bulk_load(processor.iter_transactions())
         
-        print(f"Successfully loaded {len(transactions)} transactions into the database")
+        print(f"Successfully loaded {count} transactions into the database")
     
     except Exception as e:
         print(f"Error: {str(e)}")
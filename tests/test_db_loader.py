@@ -0,0 +1,392 @@
+import random
+import struct
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+psycopg2 = pytest.importorskip('psycopg2')
+from psycopg2 import sql
+
+import db_loader
+from db_loader import PostgresTransactionLoader, _encode_binary_copy, _encode_numeric
+
+
+def decode_numeric(data):
+    """Decode PostgreSQL's binary NUMERIC format back into a Decimal"""
+    ndigits, weight, sign, dscale = struct.unpack('>hhHh', data[:8])
+    assert len(data) == 8 + 2 * ndigits
+    if sign == 0xC000:
+        return Decimal('NaN'), dscale
+    digits = struct.unpack(f'>{ndigits}H', data[8:])
+    assert all(0 <= d < 10000 for d in digits)
+    value = sum(Decimal(d) * Decimal(10000) ** (weight - i) for i, d in enumerate(digits))
+    assert sign in (0x0000, 0x4000)
+    return (-value if sign == 0x4000 else value), dscale
+
+
+@pytest.mark.parametrize('value, expected, dscale', [
+    (12.34, Decimal('12.34'), 2),
+    (1234.5, Decimal('1234.5'), 1),
+    (10000.0, Decimal('10000'), 1),
+    (99999999.99, Decimal('99999999.99'), 2),
+    (0.0001, Decimal('0.0001'), 4),
+    (-5.0, Decimal('-5'), 1),
+    (1e-07, Decimal('1E-7'), 7),
+    (1e20, Decimal('1E20'), 0),
+])
+def test_encode_numeric(value, expected, dscale):
+    assert decode_numeric(_encode_numeric(value)) == (expected, dscale)
+
+
+def test_encode_numeric_groups_base_10000():
+    # 12.34 is the groups [12, 3400] with the first group at weight 0
+    assert _encode_numeric(12.34) == struct.pack('>hhHh2H', 2, 0, 0, 2, 12, 3400)
+    # Leading and trailing zero groups are dropped and the weight adjusted
+    assert _encode_numeric(0.0001) == struct.pack('>hhHh1H', 1, -1, 0, 4, 1)
+    assert _encode_numeric(1e20) == struct.pack('>hhHh1H', 1, 5, 0, 0, 1)
+
+
+@pytest.mark.parametrize('value', [0.0, -0.0])
+def test_encode_numeric_zero_has_no_digits_and_positive_sign(value):
+    ndigits, weight, sign, _ = struct.unpack('>hhHh', _encode_numeric(value))
+    assert (ndigits, weight, sign) == (0, 0, 0)
+
+
+def test_encode_numeric_special_values():
+    assert _encode_numeric(float('nan')) == struct.pack('>hhHh', 0, 0, 0xC000, 0)
+    assert _encode_numeric(float('inf')) == struct.pack('>hhHh', 0, 0, 0xD000, 0)
+    assert _encode_numeric(float('-inf')) == struct.pack('>hhHh', 0, 0, 0xF000, 0)
+
+
+def test_encode_numeric_random_amounts():
+    rng = random.Random(0)
+    for _ in range(10000):
+        value = round(rng.uniform(-1e8, 1e8), 2)
+        assert decode_numeric(_encode_numeric(value))[0] == Decimal(repr(value))
+
+
+def test_encode_binary_copy_framing():
+    rows = [('2000-01-01', 'Café', 12.34, ''), ('1999-12-31', 'Rent', -5.0, 'Housing')]
+    data = _encode_binary_copy(rows, 'utf-8').read()
+
+    assert data[:19] == b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+    assert data[-2:] == struct.pack('>h', -1)
+
+    pos = 19
+    decoded = []
+    while struct.unpack_from('>h', data, pos)[0] != -1:
+        (nfields,) = struct.unpack_from('>h', data, pos)
+        assert nfields == 4
+        pos += 2
+        fields = []
+        for _ in range(nfields):
+            (length,) = struct.unpack_from('>i', data, pos)
+            fields.append(data[pos + 4:pos + 4 + length])
+            pos += 4 + length
+        decoded.append(fields)
+    assert pos == len(data) - 2
+
+    # DATE is an int32 count of days since 2000-01-01
+    assert [struct.unpack('>i', row[0])[0] for row in decoded] == [0, -1]
+    assert [row[1].decode('utf-8') for row in decoded] == ['Café', 'Rent']
+    assert [decode_numeric(row[2])[0] for row in decoded] == [Decimal('12.34'), Decimal('-5')]
+    assert [row[3] for row in decoded] == [b'', b'Housing']
+
+
+def render(query):
+    """Render a psycopg2.sql composable without a server connection"""
+    if isinstance(query, sql.Composed):
+        return ''.join(render(part) for part in query.seq)
+    if isinstance(query, sql.SQL):
+        return query.string
+    if isinstance(query, sql.Identifier):
+        return '.'.join(f'"{name}"' for name in query.strings)
+    return query
+
+
+class FakeCursor:
+    """Cursor that records statements on its connection instead of running them"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.result = []
+
+    def execute(self, query, params=None):
+        statement = ' '.join(render(query).split())
+        self.connection.log.append(statement)
+        self.result = [row for prefix, row in self.connection.results if statement.startswith(prefix)]
+
+    def copy_expert(self, query, file):
+        self.connection.log.append(' '.join(render(query).split()))
+        self.connection.copied.append(file.read())
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    encoding = 'UTF8'
+
+    def __init__(self, results=()):
+        self.autocommit = True
+        self.log = []
+        self.copied = []
+        # (statement prefix, row) pairs returned to matching queries
+        self.results = list(results)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.log.append('COMMIT')
+
+    def rollback(self):
+        self.log.append('ROLLBACK')
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn):
+        pass
+
+
+def make_loader(results=(), **kwargs):
+    conn = FakeConnection(results)
+    loader = PostgresTransactionLoader(pool=FakePool(conn), **kwargs)
+    loader.connect()
+    return loader, conn.log
+
+
+def assert_statements(log, expected):
+    assert len(log) == len(expected), log
+    for statement, prefix in zip(log, expected):
+        assert statement.startswith(prefix), (statement, prefix)
+
+
+ROWS = [('2024-01-02', 'Coffee', 3.5, 'Food'), ('2024-01-03', 'Rent', -1200.0, 'Housing')]
+
+
+def test_connect_disables_autocommit():
+    loader, _ = make_loader()
+    assert loader.conn.autocommit is False
+
+
+def test_bulk_load_copies_directly_in_one_transaction():
+    loader, log = make_loader()
+    assert loader.bulk_load(iter(ROWS)) == 2
+    assert_statements(log, [
+        'CREATE TABLE IF NOT EXISTS transactions',
+        'SET LOCAL synchronous_commit TO off',
+        'SET LOCAL maintenance_work_mem',
+        'COPY "transactions" ',
+        'COMMIT',
+    ])
+
+
+def test_staged_bulk_load_merges_and_empties_staging():
+    loader, log = make_loader(staged=True)
+    assert loader.bulk_load(iter(ROWS)) == 2
+    assert_statements(log, [
+        'CREATE TABLE IF NOT EXISTS transactions',
+        'SET LOCAL synchronous_commit TO off',
+        'SET LOCAL maintenance_work_mem',
+        'TRUNCATE transactions_staging',
+        'COPY "transactions_staging" ',
+        'INSERT INTO transactions',
+        'TRUNCATE transactions_staging',
+        'COMMIT',
+    ])
+
+
+def test_load_dataframe_writes_nan_amounts_as_nan():
+    pd = pytest.importorskip('pandas')
+    df = pd.DataFrame({'date': ['2024-01-02', '2024-01-03'], 'description': ['Coffee', 'Refund'],
+                       'amount': [3.5, float('nan')], 'category': ['Food', '']})
+    loader, log = make_loader()
+    assert loader.load_dataframe(df) == 2
+    assert_statements(log, [
+        'SET LOCAL synchronous_commit TO off',
+        'SET LOCAL maintenance_work_mem',
+        'COPY "transactions" (transaction_date, description, amount, category) FROM STDIN WITH CSV',
+        'COMMIT',
+    ])
+    assert loader.conn.copied == ['"2024-01-02","Coffee",3.5,"Food"\n"2024-01-03","Refund","NaN",""\n']
+
+
+def test_bad_row_rolls_back_the_whole_load():
+    def rows():
+        yield ROWS[0]
+        raise ValueError('Amount standardization error: bad')
+
+    loader, log = make_loader(staged=True)
+    with pytest.raises(ValueError, match='Amount standardization error'):
+        loader.bulk_load(rows())
+    assert log[-1] == 'ROLLBACK'
+    assert 'COMMIT' not in log
+
+
+def test_insert_path_skips_staging(monkeypatch):
+    batches = []
+    monkeypatch.setattr(db_loader, 'execute_values',
+                        lambda cursor, query, rows, page_size: batches.append(list(rows)))
+    loader, log = make_loader(use_copy=False, staged=True)
+    assert loader.load_transactions(iter(ROWS)) == 2
+    assert batches == [ROWS]
+    assert not [statement for statement in log if 'staging' in statement or 'COPY' in statement]
+    assert log.count('COMMIT') == 1
+
+
+def test_prepare_insert_reuses_existing_statement(monkeypatch):
+    monkeypatch.setattr(db_loader, 'execute_batch', lambda *args, **kwargs: None)
+    loader, log = make_loader(results=[('SELECT 1 FROM pg_prepared_statements', (1,))],
+                              use_copy=False, prepare_inserts=True)
+    loader.load_transactions(iter(ROWS))
+    loader.load_transactions(iter(ROWS))
+    assert log.count("SELECT 1 FROM pg_prepared_statements WHERE name = 'insert_transaction'") == 1
+    assert not [statement for statement in log if statement.startswith('PREPARE')]
+
+
+def test_prepare_insert_prepares_once_per_connection(monkeypatch):
+    monkeypatch.setattr(db_loader, 'execute_batch', lambda *args, **kwargs: None)
+    loader, log = make_loader(use_copy=False, prepare_inserts=True)
+    loader.load_transactions(iter(ROWS))
+    loader.load_transactions(iter(ROWS))
+    assert len([statement for statement in log if statement.startswith('PREPARE')]) == 1
+
+
+class FakeProcessor:
+    file_path = 'transactions.csv'
+
+    def split_file(self, parts):
+        return (0, 1, 2, 3), [(0, 10), (10, 20), (20, 30)]
+
+
+def test_load_parallel_drops_worker_tables_when_a_worker_fails(monkeypatch):
+    def copy_chunk(file_path, start, end, indices, table):
+        if start == 10:
+            raise ValueError('Date standardization error: Unable to parse date: bad')
+        return 5
+
+    monkeypatch.setattr(db_loader, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    monkeypatch.setattr(db_loader, '_copy_chunk', copy_chunk)
+    loader, log = make_loader()
+    with pytest.raises(Exception, match='Error loading transactions: Date standardization'):
+        loader.load_parallel(FakeProcessor(), workers=3)
+    assert_statements(log, [
+        'CREATE TABLE IF NOT EXISTS transactions',
+        'COMMIT',
+        'DROP TABLE IF EXISTS "transactions_staging_0"',
+        'DROP TABLE IF EXISTS "transactions_staging_1"',
+        'DROP TABLE IF EXISTS "transactions_staging_2"',
+        'COMMIT',
+    ])
+
+
+def test_load_parallel_merges_worker_tables(monkeypatch):
+    monkeypatch.setattr(db_loader, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    monkeypatch.setattr(db_loader, '_copy_chunk', lambda *args: 5)
+    loader, log = make_loader()
+    assert loader.load_parallel(FakeProcessor(), workers=3) == 15
+    assert_statements(log, [
+        'CREATE TABLE IF NOT EXISTS transactions',
+        'COMMIT',
+        'SET LOCAL synchronous_commit TO off',
+        'SET LOCAL maintenance_work_mem',
+        'INSERT INTO transactions',
+        'INSERT INTO transactions',
+        'INSERT INTO transactions',
+        'COMMIT',
+    ])
+    assert [statement.split('FROM ')[-1] for statement in log if statement.startswith('INSERT')] == [
+        f'"transactions_staging_{i}"; TRUNCATE "transactions_staging_{i}"' for i in range(3)]
+
+
+class FakeAdbcCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        self.log.append(' '.join(query.split()))
+
+    def adbc_ingest(self, table_name, data, mode, temporary):
+        self.log.append(('ingest', table_name, data.column_names, mode, temporary))
+
+
+class FakeAdbcConnection:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return FakeAdbcCursor(self.log)
+
+    def commit(self):
+        self.log.append('COMMIT')
+
+
+def test_ingest_arrow(monkeypatch):
+    pa = pytest.importorskip('pyarrow')
+    log = []
+    dbapi = types.ModuleType('adbc_driver_postgresql.dbapi')
+    dbapi.Error = Exception
+    dbapi.connect = lambda uri: FakeAdbcConnection(log)
+    package = types.ModuleType('adbc_driver_postgresql')
+    package.dbapi = dbapi
+    monkeypatch.setitem(sys.modules, 'adbc_driver_postgresql', package)
+    monkeypatch.setitem(sys.modules, 'adbc_driver_postgresql.dbapi', dbapi)
+
+    table = pa.table({'date': ['2024-01-02'], 'description': ['Coffee'],
+                      'amount': [3.5], 'category': ['Food']})
+    assert db_loader.ingest_arrow(table) == 1
+    assert log[0] == ' '.join(db_loader.CREATE_TRANSACTIONS_TABLE.split())
+    assert log[1:] == [
+        'SET LOCAL synchronous_commit TO off',
+        ('ingest', 'transactions_arrow_staging',
+         ['transaction_date', 'description', 'amount', 'category'], 'replace', True),
+        'INSERT INTO transactions (transaction_date, description, amount, category) '
+        'SELECT transaction_date, description, amount, category FROM transactions_arrow_staging',
+        'COMMIT',
+    ]
+
+
+def test_get_connection_pool_creates_one_pool_across_threads(monkeypatch):
+    created = []
+
+    def make_pool(*args, **kwargs):
+        # Widen the race window between the check and the assignment
+        time.sleep(0.01)
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr(db_loader, '_pool', None)
+    monkeypatch.setattr(db_loader, 'ThreadedConnectionPool', make_pool)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pools = list(executor.map(lambda _: db_loader.get_connection_pool(), range(8)))
+    assert len(created) == 1
+    assert all(pool is created[0] for pool in pools)
@@ -0,0 +1,48 @@
+import itertools
+
+import pytest
+
+import transaction_processor
+
+_fastrow = pytest.importorskip('_fastrow')
+
+INDICES = (0, 1, 2, 3)
+
+DATES = [
+    f'{y}{sep1}{a}{sep2}{b}' if len(y) == 4 and first else f'{a}{sep1}{b}{sep2}{y}'
+    for a, b in itertools.product(['1', '01', '12', '13', '29', '30', '31', '00', '001', ''], repeat=2)
+    for y in ['2024', '2023', '1900', '0000', '20245']
+    for sep1, sep2 in [('-', '-'), ('/', '/'), ('-', '/')]
+    for first in (True, False)
+] + ['', ' 2024-01-01', '2024-01-01\n', '2024--01', 'abc', '１/２/2024']
+
+AMOUNTS = ['$1,234.50', '-€5', '£12.99', ' 3 ', '1_000', '', 'abc', '1e5', 'nan', 'inf', '-0',
+           '12\n', '0x10', '1' * 70, '$', '.5', '5.', '+3', '1 234', '١٢',
+           '\n12', '\r5', '\x0b3', '\x0c1', '\x001', '1\x00']
+
+ROWS = (
+    [[d, ' desc ', '$1.00', 'cat '] for d in DATES]
+    + [['2024-01-01', 'desc', a, 'cat'] for a in AMOUNTS]
+    # Short and ragged rows, e.g. a trailing "Total,,123" summary line
+    + [[], ['2024-01-01'], ['2024-01-01', 'd'], ['bad', 'd'], ['2024-01-01', 'd', '1'],
+       ['Total', '', '123']]
+)
+
+
+def _standardize(row, fast):
+    saved = transaction_processor._fast_parse_row
+    transaction_processor._fast_parse_row = _fastrow.parse_row if fast else None
+    try:
+        return transaction_processor._standardize_row(row, INDICES)
+    except Exception as e:
+        return (type(e), str(e))
+    finally:
+        transaction_processor._fast_parse_row = saved
+
+
+@pytest.mark.parametrize('row', ROWS, ids=repr)
+def test_fast_path_matches_python(row):
+    fast = _standardize(row, fast=True)
+    slow = _standardize(row, fast=False)
+    # NaN compares unequal to itself, so compare the representations
+    assert repr(fast) == repr(slow)
@@ -0,0 +1,171 @@
+import itertools
+from datetime import datetime
+
+import pytest
+
+from transaction_processor import DATE_FORMATS, TransactionProcessor, _parse_date, parse_chunk
+
+
+def strptime_cascade(date_str):
+    """The original parser: try each format with strptime in order"""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return None
+
+
+@pytest.mark.parametrize('date_str, expected', [
+    ('2024-01-05', '2024-01-05'),
+    ('2024-1-5', '2024-01-05'),
+    ('2024/02/29', '2024-02-29'),
+    # Month first when both readings are valid, day first otherwise
+    ('01/02/2024', '2024-01-02'),
+    ('13/01/2024', '2024-01-13'),
+    ('1/13/2024', '2024-01-13'),
+])
+def test_parse_date(date_str, expected):
+    assert _parse_date(date_str) == expected
+
+
+@pytest.mark.parametrize('date_str', [
+    '', 'abc', '2023-02-29', '02/30/2024', '13/13/2024', '0000-01-01',
+    '24-01-01', '2024-01-011', '2024-01-01 ', '2024-01-01\n', '01-02-2024',
+])
+def test_parse_date_rejects(date_str):
+    with pytest.raises(ValueError, match='Unable to parse date'):
+        _parse_date(date_str)
+
+
+def test_parse_date_matches_strptime_cascade():
+    parts = ['1', '01', '5', '12', '13', '29', '30', '31', '00', '001']
+    for a, b in itertools.product(parts, repeat=2):
+        for year in ['2024', '2023', '1900', '2000']:
+            for date_str in (f'{year}-{a}-{b}', f'{a}/{b}/{year}', f'{year}/{a}/{b}'):
+                try:
+                    result = _parse_date(date_str)
+                except ValueError:
+                    result = None
+                assert result == strptime_cascade(date_str), date_str
+
+
+def test_standardize_date_wraps_errors():
+    with pytest.raises(ValueError, match='Date standardization error: Unable to parse date: x'):
+        TransactionProcessor._standardize_date('x')
+
+
+HEADER = 'Post Date,Description,Amount,Category\n'
+CONFIG = ('{"date_field": "Post Date", "description_field": "Description", '
+          '"amount_field": "Amount", "category_field": "Category"}')
+
+
+@pytest.fixture
+def make_processor(tmp_path):
+    def make(body, newline='\n'):
+        csv_path = tmp_path / 'transactions.csv'
+        csv_path.write_bytes((HEADER + body).replace('\n', newline).encode('utf-8'))
+        config_path = tmp_path / 'config.json'
+        config_path.write_text(CONFIG)
+        return TransactionProcessor(str(csv_path), str(config_path))
+    return make
+
+
+def sample_rows(count):
+    return ''.join(f'{i % 12 + 1}/{i % 28 + 1}/2024,"Item {i}, café",'
+                   f'"${i * 7:,}.50",Cat{i % 5}\n' for i in range(count))
+
+
+@pytest.mark.parametrize('parts', [1, 2, 3, 7, 64])
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_split_file_ranges_cover_data_on_line_boundaries(make_processor, parts, newline):
+    processor = make_processor(sample_rows(50), newline)
+    indices, ranges = processor.split_file(parts)
+    with open(processor.file_path, 'rb') as f:
+        data = f.read()
+
+    assert indices == (0, 1, 2, 3)
+    assert ranges[0][0] == data.index(b'\n') + 1
+    assert ranges[-1][1] == len(data)
+    assert all(start < end for start, end in ranges)
+    assert all(prev_end == start for (_, prev_end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(data[end - 1:end] == b'\n' for _, end in ranges[:-1])
+
+
+@pytest.mark.parametrize('parts', [1, 2, 3, 7, 64])
+def test_parse_chunk_matches_iter_transactions(make_processor, parts):
+    processor = make_processor(sample_rows(50) + '\n')
+    indices, ranges = processor.split_file(parts)
+    rows = [row for start, end in ranges
+            for row in parse_chunk(processor.file_path, start, end, indices)]
+    assert rows == list(processor.iter_transactions())
+    assert len(rows) == 50
+
+
+def test_iter_transactions_reads_the_same_text_as_parse_chunk(make_processor):
+    # Quoted line breaks are kept as written and the file is decoded as
+    # UTF-8 whatever the locale, as on the parallel path
+    processor = make_processor('2024-01-02,"Café\r\nau lait",3.50,Food\n')
+    indices, ranges = processor.split_file(1)
+    expected = [('2024-01-02', 'Café\r\nau lait', 3.5, 'Food')]
+    assert parse_chunk(processor.file_path, *ranges[0], indices) == expected
+    assert list(processor.iter_transactions()) == expected
+
+
+def test_split_file_without_trailing_newline(make_processor):
+    processor = make_processor('2024-01-01,a,1,b\n2024-01-02,c,2,d')
+    indices, ranges = processor.split_file(4)
+    rows = [row for start, end in ranges
+            for row in parse_chunk(processor.file_path, start, end, indices)]
+    assert rows == [('2024-01-01', 'a', 1.0, 'b'), ('2024-01-02', 'c', 2.0, 'd')]
+
+
+def test_split_file_header_only(make_processor):
+    assert make_processor('').split_file(4) == ((0, 1, 2, 3), [])
+
+
+def test_load_dataframe_matches_iter_transactions(make_processor):
+    pytest.importorskip('pandas')
+    processor = make_processor(sample_rows(50) + '01/02/2024,Rent," €1 200.00\t",Home\n'
+                               '2024-01-03,Refund,"-$ 5",Misc\n')
+    df = processor.load_dataframe()
+    assert list(df.itertuples(index=False, name=None)) == list(processor.iter_transactions())
+
+
+@pytest.mark.parametrize('date_str, expected', [
+    ('0001-1-1', '0001-01-01'),
+    ('12/31/0999', '0999-12-31'),
+    ('1500-02-03', '1500-02-03'),
+    ('9999-12-31', '9999-12-31'),
+])
+def test_load_dataframe_pads_and_keeps_out_of_range_years(make_processor, date_str, expected):
+    pytest.importorskip('pandas')
+    processor = make_processor(f'{date_str},Coffee,3.50,Food\n')
+    assert list(processor.load_dataframe()['date']) == [expected]
+    assert [row[0] for row in processor.iter_transactions()] == [expected]
+
+
+def test_load_dataframe_rejects_bad_date(make_processor):
+    pytest.importorskip('pandas')
+    processor = make_processor('2024-02-30,Coffee,3.50,Food\n')
+    with pytest.raises(ValueError, match='Date standardization error: Unable to parse date: 2024-02-30'):
+        processor.load_dataframe()
+
+
+def test_load_arrow_table_matches_iter_transactions(make_processor):
+    pytest.importorskip('pyarrow')
+    processor = make_processor(sample_rows(50) + '01/02/2024,Rent," €1 200.00\t",Home\n'
+                               '2024-01-03,Refund,"-$ 5",Misc\n')
+    table = processor.load_arrow_table()
+    rows = [(row['date'].isoformat(), row['description'], row['amount'], row['category'])
+            for row in table.to_pylist()]
+    assert rows == list(processor.iter_transactions())
+
+
+@pytest.mark.parametrize('amount', ['1_000', '١٢', '"\n12"'])
+def test_load_arrow_table_rejects_amounts_float_accepts(make_processor, amount):
+    pytest.importorskip('pyarrow')
+    processor = make_processor(f'2024-01-02,Coffee,{amount},Food\n')
+    assert len(list(processor.iter_transactions())) == 1
+    with pytest.raises(ValueError, match='Amount standardization error'):
+        processor.load_arrow_table()
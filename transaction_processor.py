@@ -1,8 +1,60 @@
 import csv
 import json
 import argparse
-from typing import List, Dict
-from datetime import datetime
+import calendar
+import mmap
+import multiprocessing
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Optional Cython fast path, see _fastrow.pyx
+try:
+    from _fastrow import parse_row as _fast_parse_row
+except ImportError:
+    _fast_parse_row = None
+
+# Standardized transaction fields, in the order rows are stored as tuples
+FIELDS = ('date', 'description', 'amount', 'category')
+
+# Characters _standardize_amount strips, as a regex class for the vectorized
+# paths; listed explicitly because \s differs between re and Arrow's RE2
+_AMOUNT_STRIP = '[$£€, \t\u00a0]'
+
+# Accepted input date formats, tried in order
+DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d')
+
+# Regex equivalents of DATE_FORMATS: each pattern lists the (year, month, day)
+# group orders to try, so 01/02/2024 is read as M/D/Y before D/M/Y
+_DATE_PATTERNS = (
+    (re.compile(r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})'), ((0, 1, 2),)),
+    (re.compile(r'([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})'), ((2, 0, 1), (2, 1, 0))),
+    (re.compile(r'([0-9]{4})/([0-9]{1,2})/([0-9]{1,2})'), ((0, 1, 2),)),
+)
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> str:
+    """
+    Convert a date string in one of DATE_FORMATS to YYYY-MM-DD.
+    Cached because transaction exports repeat the same dates many times.
+    """
+    for pattern, orders in _DATE_PATTERNS:
+        match = pattern.fullmatch(date_str)
+        if match is None:
+            continue
+        groups = [int(g) for g in match.groups()]
+        for y, m, d in orders:
+            year, month, day = groups[y], groups[m], groups[d]
+            if _is_valid_date(year, month, day):
+                return f"{year:04d}-{month:02d}-{day:02d}"
+    raise ValueError(f"Unable to parse date: {date_str}")
+
+def _is_valid_date(year: int, month: int, day: int) -> bool:
+    """Check a calendar date without raising, so failed formats stay cheap"""
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+    return day <= calendar.monthrange(year, month)[1]
 
 class TransactionProcessor:
     """
@@ -19,7 +71,7 @@ class TransactionProcessor:
         """
         self.file_path = file_path
         self.config_path = config_path
-        self.transactions: List[Dict] = []
+        self.transactions: List[Tuple[str, str, float, str]] = []
         self.header_mapping = self._load_config()
     
     def _load_config(self) -> Dict:
@@ -41,56 +93,243 @@ class TransactionProcessor:
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON in config file: {self.config_path}")
 
-    def load_transactions(self) -> None:
+    def load_transactions(self, vectorized: bool = False, processes: Optional[int] = None) -> None:
         """
         Load transactions from the CSV file and store them in a standardized format.
         Uses header mapping from config file to identify correct columns.
+        Rows are kept as (date, description, amount, category) tuples.
+        
+        Args:
+            vectorized (bool): Parse with pandas (see load_dataframe) instead of
+                row by row
+            processes (Optional[int]): Parse with this many worker processes
+                (see parse_parallel) instead of in this process
+        """
+        if vectorized:
+            rows = self.load_dataframe().itertuples(index=False, name=None)
+        elif processes:
+            rows = self.parse_parallel(processes)
+        else:
+            rows = self.iter_transactions()
+        self.transactions.extend(rows)
+    
+    def iter_transactions(self) -> Iterator[Tuple[str, str, float, str]]:
+        """
+        Stream standardized transactions from the CSV file one row at a time
+        without storing them. Column positions are resolved from the header
+        once, so rows are read as plain lists rather than per-row dicts.
+
+        Yields:
+            Tuple[str, str, float, str]: (date, description, amount, category)
         """
         try:
-            with open(self.file_path, 'r') as csvfile:
-                reader = csv.DictReader(csvfile)
+            with open(self.file_path, 'r', encoding='utf-8', newline='') as csvfile:
+                reader = csv.reader(csvfile)
+                indices = self._resolve_columns(next(reader, []))
                 for row in reader:
-                    transaction = {
-                        'date': self._standardize_date(row.get(self.header_mapping['date_field'], '')),
-                        'description': row.get(self.header_mapping['description_field'], '').strip(),
-                        'amount': self._standardize_amount(row.get(self.header_mapping['amount_field'], '0')),
-                        'category': row.get(self.header_mapping['category_field'], '').strip()
-                    }
-                    self.transactions.append(transaction)
+                    if row:
+                        yield _standardize_row(row, indices)
         except FileNotFoundError:
             raise FileNotFoundError(f"CSV file not found: {self.file_path}")
         except Exception as e:
             raise Exception(f"Error loading transactions: {str(e)}")
-    
-    def _standardize_date(self, date_str: str) -> str:
+
+    def parse_parallel(self, processes: Optional[int] = None) -> List[Tuple[str, str, float, str]]:
+        """
+        Parse the CSV file with a pool of worker processes, each standardizing
+        one byte range of the file. Ranges are split on line boundaries, so
+        quoted fields must not contain newlines.
+
+        Args:
+            processes (Optional[int]): Number of worker processes, defaults to
+                the CPU count
+
+        Returns:
+            List[Tuple[str, str, float, str]]: Rows in file order
+        """
+        processes = processes or os.cpu_count() or 1
+        try:
+            indices, ranges = self.split_file(processes)
+            tasks = [(self.file_path, start, end, indices) for start, end in ranges]
+            with multiprocessing.Pool(processes) as pool:
+                chunks = pool.starmap(parse_chunk, tasks)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {self.file_path}")
+        except Exception as e:
+            raise Exception(f"Error loading transactions: {str(e)}")
+        return [row for chunk in chunks for row in chunk]
+
+    def split_file(self, parts: int) -> Tuple[Tuple[int, int, int, int], List[Tuple[int, int]]]:
+        """
+        Read the header and split the rest of the file into roughly equal
+        byte ranges that each start and end on a line boundary.
+
+        Returns:
+            Tuple: Column indices from _resolve_columns and (start, end) offsets
+        """
+        size = os.path.getsize(self.file_path)
+        if size == 0:
+            return self._resolve_columns([]), []
+        with open(self.file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b'\n')
+            data_start = size if header_end < 0 else header_end + 1
+            indices = self._resolve_columns(next(csv.reader([mm[:data_start].decode('utf-8')]), []))
+            bounds = [data_start]
+            for i in range(1, parts):
+                # Snap to just after the first newline at or before the target
+                newline = mm.find(b'\n', max(data_start + (size - data_start) * i // parts, bounds[-1]) - 1)
+                bounds.append(size if newline < 0 else newline + 1)
+            bounds.append(size)
+        return indices, [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+    def load_dataframe(self):
+        """
+        Load and standardize the CSV file with pandas, operating on whole
+        columns at a time instead of row by row. Requires pandas.
+
+        Returns:
+            pandas.DataFrame: Columns date, description, amount and category
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for vectorized loading: pip install pandas")
+
+        columns = {self.header_mapping[f'{field}_field']: field for field in FIELDS}
+        try:
+            df = pd.read_csv(self.file_path, usecols=list(columns), dtype=str, keep_default_na=False)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {self.file_path}")
+        except Exception as e:
+            raise Exception(f"Error loading transactions: {str(e)}")
+        df = df.rename(columns=columns)[list(FIELDS)]
+
+        # Same precedence as _standardize_date: first matching format wins
+        dates = None
+        for fmt in DATE_FORMATS:
+            parsed = pd.to_datetime(df['date'], format=fmt, errors='coerce')
+            dates = parsed if dates is None else dates.fillna(parsed)
+        valid = dates.notna()
+        parsed = dates[valid]
+        standard = pd.Series(index=df.index, dtype=object)
+        # strftime does not zero-pad years below 1000, so format the parts
+        standard[valid] = (parsed.dt.year.astype(str).str.zfill(4) + '-'
+                           + parsed.dt.month.astype(str).str.zfill(2) + '-'
+                           + parsed.dt.day.astype(str).str.zfill(2))
+        # Dates outside the datetime64 range (years before 1677 or after 2262
+        # on pandas < 3) go to the row parser, which raises for invalid ones
+        standard[~valid] = df['date'][~valid].map(self._standardize_date)
+        df['date'] = standard
+
+        try:
+            df['amount'] = df['amount'].str.replace(_AMOUNT_STRIP, '', regex=True).astype('float64')
+        except ValueError as e:
+            raise ValueError(f"Amount standardization error: {str(e)}")
+        df['description'] = df['description'].str.strip()
+        df['category'] = df['category'].str.strip()
+        return df
+
+    def load_arrow_table(self):
+        """
+        Load and standardize the CSV file as a pyarrow Table. Parsing runs in
+        Arrow's multithreaded C++ reader and the standardization in Arrow
+        compute kernels, so no Python objects are created per row. Requires
+        pyarrow.
+
+        Amounts are cast by Arrow, which is stricter than float(): digit
+        separators ('1_000'), non-ASCII digits and leading or trailing
+        newlines are rejected here although the row path accepts them.
+
+        Returns:
+            pyarrow.Table: Columns date (date32), description, amount (float64)
+                and category
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            raise ImportError("pyarrow is required for Arrow loading: pip install pyarrow")
+
+        columns = {self.header_mapping[f'{field}_field']: field for field in FIELDS}
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=list(columns),
+            column_types={name: pa.string() for name in columns}
+        )
+        try:
+            table = pa_csv.read_csv(self.file_path, convert_options=convert_options)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {self.file_path}")
+        except Exception as e:
+            raise Exception(f"Error loading transactions: {str(e)}")
+        table = table.rename_columns([columns[name] for name in table.column_names])
+
+        # Same precedence as _standardize_date: first matching format wins
+        raw_dates = table['date']
+        padded = pc.replace_substring_regex(raw_dates, pattern=r'\b([0-9])\b', replacement=r'0\1')
+        candidates = []
+        for fmt in DATE_FORMATS:
+            parsed = pc.strptime(raw_dates, format=fmt, unit='s', error_is_null=True)
+            # Arrow's strptime rolls impossible days over (02/30 -> 03/01), so
+            # only keep dates that format back to the zero-padded input
+            valid = pc.equal(pc.strftime(parsed, format=fmt), padded)
+            candidates.append(pc.if_else(valid, parsed, None))
+        dates = pc.coalesce(*candidates)
+        if dates.null_count:
+            bad = raw_dates.filter(pc.is_null(dates))[0].as_py()
+            raise ValueError(f"Date standardization error: Unable to parse date: {bad}")
+
+        try:
+            amounts = pc.cast(pc.replace_substring_regex(table['amount'], pattern=_AMOUNT_STRIP,
+                                                         replacement=''), pa.float64())
+        except pa.ArrowInvalid as e:
+            raise ValueError(f"Amount standardization error: {str(e)}")
+
+        return pa.table({
+            'date': pc.cast(dates, pa.date32()),
+            'description': pc.utf8_trim_whitespace(table['description']),
+            'amount': amounts,
+            'category': pc.utf8_trim_whitespace(table['category'])
+        })
+
+    def _resolve_columns(self, header: List[str]) -> Tuple[int, int, int, int]:
+        """
+        Resolve the positions of the mapped columns in the CSV header.
+
+        Returns:
+            Tuple[int, int, int, int]: Indices of the date, description, amount
+                and category columns
+        """
+        fields = ('date_field', 'description_field', 'amount_field', 'category_field')
+        try:
+            return tuple(header.index(self.header_mapping[field]) for field in fields)
+        except ValueError:
+            missing = [self.header_mapping[f] for f in fields if self.header_mapping[f] not in header]
+            raise ValueError(f"CSV header missing columns: {', '.join(missing)}")
+
+    @staticmethod
+    def _standardize_date(date_str: str) -> str:
         """
         Convert date string to standard YYYY-MM-DD format.
         Handles common date formats.
         """
         try:
-            # Add more date formats as needed
-            for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d'):
-                try:
-                    return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
-                except ValueError:
-                    continue
-            raise ValueError(f"Unable to parse date: {date_str}")
-        except Exception as e:
+            return _parse_date(date_str)
+        except ValueError as e:
             raise ValueError(f"Date standardization error: {str(e)}")
     
-    def _standardize_amount(self, amount_str: str) -> float:
+    @staticmethod
+    def _standardize_amount(amount_str: str) -> float:
         """
         Convert amount string to standard float format.
         Handles common currency formats and converts to float.
+        Raises ValueError if the remaining text is not a number.
         """
-        try:
-            # Remove currency symbols and whitespace
-            amount = amount_str.replace('$', '').replace('£', '').replace('€', '').strip()
-            # Replace commas with empty string for proper float conversion
-            amount = amount.replace(',', '')
-            return float(amount)
-        except Exception as e:
-            raise ValueError(f"Amount standardization error: {str(e)}")
+        # Chained replace beats str.translate here: deleting non-ASCII
+        # characters takes translate's slow path, and replace returns the
+        # string itself when the character is absent
+        return float(amount_str.replace('$', '').replace('£', '').replace('€', '')
+                     .replace(',', '').replace(' ', '').replace('\t', '').replace('\u00a0', ''))
     
     def get_transactions(self) -> List[Dict]:
         """
@@ -99,7 +338,7 @@ class TransactionProcessor:
         Returns:
             List[Dict]: List of standardized transaction dictionaries
         """
-        return self.transactions
+        return [dict(zip(FIELDS, row)) for row in self.transactions]
     
     def write_standardized_csv(self, output_path: str) -> None:
         """
@@ -113,28 +352,72 @@ class TransactionProcessor:
             
         try:
             with open(output_path, 'w', newline='') as csvfile:
-                fieldnames = ['date', 'description', 'amount', 'category']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDS)
                 writer.writerows(self.transactions)
         except Exception as e:
             raise Exception(f"Error writing standardized CSV: {str(e)}")
 
+def _standardize_row(row: List[str], indices: Tuple[int, int, int, int]) -> Tuple[str, str, float, str]:
+    """Standardize one CSV row given the column indices from _resolve_columns"""
+    if _fast_parse_row is not None:
+        return _fast_parse_row(row, indices, TransactionProcessor._standardize_date,
+                               TransactionProcessor._standardize_amount)
+    date_idx, desc_idx, amt_idx, cat_idx = indices
+    # str.strip returns the same object when there is nothing to strip, so
+    # clean columns cost no allocation
+    return (
+        TransactionProcessor._standardize_date(row[date_idx]),
+        row[desc_idx].strip(),
+        TransactionProcessor._standardize_amount(row[amt_idx]),
+        row[cat_idx].strip()
+    )
+
+def parse_chunk(file_path: str, start: int, end: int,
+                indices: Tuple[int, int, int, int]) -> List[Tuple[str, str, float, str]]:
+    """Standardize the CSV rows between two byte offsets (worker process entry point)"""
+    return list(iter_chunk(file_path, start, end, indices))
+
+def iter_chunk(file_path: str, start: int, end: int,
+               indices: Tuple[int, int, int, int]) -> Iterator[Tuple[str, str, float, str]]:
+    """Stream the standardized CSV rows between two line-aligned byte offsets"""
+    for row in csv.reader(_iter_lines(file_path, start, end)):
+        if row:
+            yield _standardize_row(row, indices)
+
+def _iter_lines(file_path: str, start: int, end: int) -> Iterator[str]:
+    """
+    Yield the decoded lines between two line-aligned byte offsets. Buffered
+    binary line iteration measured faster than slicing an mmap line by line.
+    """
+    if start >= end:
+        return
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        for line in f:
+            yield line.decode('utf-8')
+            remaining -= len(line)
+            if remaining <= 0:
+                return
+
 def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(description='Process bank transaction CSV files')
     parser.add_argument('input_file', help='Path to the input CSV file')
     parser.add_argument('output_file', help='Path to the output CSV file')
     parser.add_argument('--config', required=True, help='Path to the config JSON file')
+    parser.add_argument('--vectorized', action='store_true', help='Parse the CSV with pandas')
+    parser.add_argument('--processes', type=int, help='Parse the CSV with this many worker processes')
     
     args = parser.parse_args()
 
     try:
         # Initialize and run the processor
         processor = TransactionProcessor(args.input_file, args.config)
-        processor.load_transactions()
+        processor.load_transactions(vectorized=args.vectorized, processes=args.processes)
         processor.write_standardized_csv(args.output_file)
-        print(f"Successfully processed {len(processor.get_transactions())} transactions")
+        print(f"Successfully processed {len(processor.transactions)} transactions")
     except Exception as e:
         print(f"Error: {str(e)}")
         exit(1)